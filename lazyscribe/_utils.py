@@ -0,0 +1,28 @@
+"""Internal utilities."""
+
+from datetime import datetime
+from typing import Any
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a metric or parameter value for JSON serialization.
+
+    Parameters
+    ----------
+    value : Any
+        The value. Datetimes are converted to ISO strings and dictionaries, lists,
+        tuples and sets are copied recursively.
+
+    Returns
+    -------
+    Any
+        Converted value for easy serialization.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    if isinstance(value, dict):
+        return {key: _serialize_value(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_serialize_value(val) for val in value]
+
+    return value
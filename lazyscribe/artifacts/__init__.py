@@ -1,5 +1,6 @@
 """Import the handlers."""
 
+from functools import lru_cache
 from typing import List, Type
 
 try:
@@ -12,8 +13,11 @@ from lazyscribe.artifacts.base import Artifact
 __all__: List[str] = ["_get_handler"]
 
 
-def _get_handler(alias: str) -> Type[Artifact]:
-    """Retrieve a specific handler based on the alias.
+@lru_cache(maxsize=None)
+def _load_entry_point(alias: str) -> Type[Artifact]:
+    """Load a handler registered through the ``lazyscribe.artifact_type`` entry points.
+
+    Successful loads are cached, so the entry points are only searched once per alias.
 
     Parameters
     ----------
@@ -23,12 +27,16 @@ def _get_handler(alias: str) -> Type[Artifact]:
     Returns
     -------
     Artifact
-        The artifact handler class object. This object will need to be constructed
-        using :py:meth:`lazyscribe.artifacts.Artifact.construct`.
+        The artifact handler class object.
+
+    Raises
+    ------
+    KeyError
+        Raised if no entry point is registered with the alias.
     """
     entry = entry_points(group="lazyscribe.artifact_type")
 
-    for full_artifact_class in entry:  # search through entrypoints first
+    for full_artifact_class in entry:
         if full_artifact_class.name == alias:
             try:
                 mod = full_artifact_class.load()
@@ -40,18 +48,37 @@ def _get_handler(alias: str) -> Type[Artifact]:
             if not isinstance(mod, type):
                 raise TypeError(f"{full_artifact_class} is not a class")
 
-            break
+            return mod
+
+    raise KeyError(alias)
+
+
+def _get_handler(alias: str) -> Type[Artifact]:
+    """Retrieve a specific handler based on the alias.
+
+    Parameters
+    ----------
+    alias : str
+        The alias for the handler.
 
-    else:
-        for obj in Artifact.__subclasses__():  # search through experiment subclasses
-            if obj.alias == alias:
-                mod = obj
-                break
+    Returns
+    -------
+    Artifact
+        The artifact handler class object. This object will need to be constructed
+        using :py:meth:`lazyscribe.artifacts.Artifact.construct`.
+    """
+    try:  # search through entrypoints first
+        return _load_entry_point(alias)
+    except KeyError:
+        pass
 
-        # no handler found in both entrypoints or subclass
-        else:
-            raise ValueError(
-                f"No handler available with the name {alias} in `artifact_type` group."
-            )
+    # Subclass lookups are not cached: until garbage collection runs,
+    # ``__subclasses__`` can still hold classes that ``attrs`` has replaced
+    for obj in Artifact.__subclasses__():  # search through experiment subclasses
+        if obj.alias == alias:
+            return obj
 
-    return mod  # type: ignore
+    # no handler found in both entrypoints or subclass
+    raise ValueError(
+        f"No handler available with the name {alias} in `artifact_type` group."
+    )
@@ -2,9 +2,33 @@
 
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
-from typing import Any, ClassVar, Dict, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
-from attrs import define, field
+from attrs import define, field, fields
+
+from lazyscribe._utils import _serialize_value
+
+
+@lru_cache(maxsize=None)
+def _metadata_fields(artifact_cls: Type["Artifact"]) -> Tuple[str, ...]:
+    """Get the names of the fields that are serialized to the project JSON.
+
+    Parameters
+    ----------
+    artifact_cls : Type[Artifact]
+        The artifact handler class.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The field names, excluding the artifact value and writer keyword arguments.
+    """
+    return tuple(
+        attr.name
+        for attr in fields(artifact_cls)
+        if attr.name not in ("value", "writer_kwargs")
+    )
 
 
 @define
@@ -94,6 +118,22 @@ class Artifact(metaclass=ABCMeta):
         """
         pass
 
+    def to_dict(self) -> Dict:
+        """Serialize the artifact metadata for the project JSON.
+
+        Returns
+        -------
+        Dict
+            The artifact metadata, including the handler alias. Datetimes are
+            converted to ISO strings and collections are copied recursively.
+        """
+        out: Dict[str, Any] = {}
+        for name in _metadata_fields(type(self)):
+            out[name] = _serialize_value(getattr(self, name))
+        out["handler"] = self.alias
+
+        return out
+
     @classmethod
     @abstractmethod
     def read(cls, buf, **kwargs):
@@ -2,28 +2,137 @@
 
 import getpass
 import inspect
+import io
 import json
 import logging
+import sys
 import warnings
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
-from attrs import Factory, asdict, define, field, fields, filters, frozen
+from attrs import Factory, define, field, frozen
 from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
 from slugify import slugify
 
+from lazyscribe._utils import _serialize_value
 from lazyscribe.artifacts import Artifact, _get_handler
 from lazyscribe.test import ReadOnlyTest, Test
 
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _default_author() -> str:
+    """Get the current user.
+
+    The value is looked up once per session and interned so every experiment
+    shares the same string object.
+
+    Returns
+    -------
+    str
+        The output of ``getpass.getuser()``.
+    """
+    return sys.intern(getpass.getuser())
+
+
+@lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    """Slugify a string, caching the result.
+
+    Projects tend to log many experiments with the same name, so caching avoids
+    running the full ``slugify`` pipeline for every new experiment.
+
+    Parameters
+    ----------
+    value : str
+        The string to slugify.
+
+    Returns
+    -------
+    str
+        The slug.
+    """
+    return slugify(value)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string value.
+
+    Parameters
+    ----------
+    value : Any
+        The value to intern. Anything other than a ``str`` is returned unchanged.
+
+    Returns
+    -------
+    Any
+        The interned value.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+
+    return value
+
+
+@lru_cache(maxsize=None)
+def _artifact_construct_params(artifact_cls: Type[Artifact]) -> Tuple[str, ...]:
+    """Get the ``construct`` parameters that are re-used when loading an artifact.
+
+    Parameters
+    ----------
+    artifact_cls : Type[Artifact]
+        The artifact handler class.
+
+    Returns
+    -------
+    tuple
+        The names of the public, named parameters for
+        :py:meth:`lazyscribe.artifacts.Artifact.construct`, excluding ``value``,
+        ``fname``, and ``created_at``.
+    """
+    return tuple(
+        name
+        for name, param in inspect.signature(artifact_cls.construct).parameters.items()
+        if name not in ("value", "fname", "created_at")
+        and not name.startswith("_")
+        and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+    )
+
+
+def _artifact_environment(artifact: Artifact) -> Dict:
+    """Get the artifact metadata that describes the runtime environment.
+
+    Parameters
+    ----------
+    artifact : Artifact
+        The artifact handler.
+
+    Returns
+    -------
+    Dict
+        The artifact metadata, excluding identifying fields that are not used for
+        validation.
+    """
+    metadata = artifact.to_dict()
+    for key in ("name", "fname", "created_at", "handler"):
+        metadata.pop(key, None)
+
+    return metadata
+
+
 def serializer(inst, field, value):
     """Datetime and dependencies converter for :meth:`attrs.asdict`.
 
+    .. deprecated:: 0.7.0
+
+        Experiments are no longer serialized through :meth:`attrs.asdict`. Use
+        :py:meth:`lazyscribe.experiment.Experiment.to_dict` instead.
+
     Parameters
     ----------
     inst
@@ -38,39 +147,27 @@ def serializer(inst, field, value):
     Any
         Converted value for easy serialization.
     """
+    warnings.warn(
+        "``serializer`` is deprecated. Use ``Experiment.to_dict`` instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if isinstance(value, datetime):
         return value.isoformat(timespec="seconds")
     if field is not None and field.name == "dependencies":
         new = [f"{exp.project}|{exp.slug}" for exp in value.values()]
         return new
     if field is not None and field.name == "tests":
-        new = [asdict(test) for test in value]
+        new = [test.to_dict() for test in value]
         return new
     if field is not None and field.name == "artifacts":
-        new = [
-            {
-                **asdict(
-                    artifact,
-                    filter=filters.exclude(
-                        fields(type(artifact)).value,
-                        fields(type(artifact)).writer_kwargs,
-                    ),
-                    value_serializer=lambda _, __, value: value.isoformat(
-                        timespec="seconds"
-                    )
-                    if isinstance(value, datetime)
-                    else value,
-                ),
-                "handler": artifact.alias,
-            }
-            for artifact in value
-        ]
+        new = [artifact.to_dict() for artifact in value]
         return new
 
     return value
 
 
-@define
+@define(slots=True)
 class Experiment:
     """Experiment data class.
 
@@ -103,18 +200,18 @@ class Experiment:
     project: Path = field(eq=False)
     dir: Path = field(eq=False)
     fs: AbstractFileSystem = field(eq=False)
-    author: str = Factory(getpass.getuser)
-    last_updated_by: str = field()
-    metrics: Dict = Factory(lambda: {})
-    parameters: Dict = Factory(lambda: {})
+    author: str = field(factory=_default_author, converter=_intern)
+    last_updated_by: str = field(converter=_intern)
+    metrics: Dict = Factory(dict)
+    parameters: Dict = Factory(dict)
     created_at: datetime = Factory(datetime.now)
     last_updated: datetime = Factory(datetime.now)
-    dependencies: Dict = field(eq=False, factory=lambda: {})
-    short_slug: str = field()
-    slug: str = field()
-    tests: List[Union[Test, ReadOnlyTest]] = Factory(lambda: [])
-    artifacts: List[Artifact] = Factory(factory=lambda: [])
-    tags: List[str] = Factory(factory=lambda: [])
+    dependencies: Dict = field(eq=False, factory=dict)
+    short_slug: str = field(converter=_intern)
+    slug: str = field(converter=_intern)
+    tests: List[Union[Test, ReadOnlyTest]] = Factory(list)
+    artifacts: List[Artifact] = Factory(list)
+    tags: List[str] = Factory(list)
 
     @dir.default
     def _dir_factory(self) -> Path:
@@ -152,7 +249,7 @@ class Experiment:
         str
             The slugified experiment name.
         """
-        return slugify(self.name)
+        return _slugify(self.name)
 
     @slug.default
     def _slug_factory(self) -> str:
@@ -163,7 +260,12 @@ class Experiment:
         str
             Experiment slug, in the format `{name}-{created_at}-{author}`.
         """
-        return slugify(f"{self.name}-{self.created_at.strftime('%Y%m%d%H%M%S')}")
+        # The timestamp is already slug-safe, so only the name needs slugifying
+        name = _slugify(self.name)
+        c = self.created_at
+        timestamp = f"{c.year:04d}{c.month:02d}{c.day:02d}{c.hour:02d}{c.minute:02d}{c.second:02d}"
+
+        return f"{name}-{timestamp}" if name else timestamp
 
     @property
     def path(self) -> Path:
@@ -209,6 +311,34 @@ class Experiment:
         self.last_updated = datetime.now()
         self.parameters[name] = value
 
+    def log_metrics(self, metrics: Dict[str, Union[float, int]]):
+        """Log multiple metrics to the experiment.
+
+        This method will overwrite existing keys. The ``last_updated`` timestamp is
+        only refreshed once for the whole batch.
+
+        Parameters
+        ----------
+        metrics : dict
+            A dictionary with the metric name as the key and the metric value as the value.
+        """
+        self.last_updated = datetime.now()
+        self.metrics.update(metrics)
+
+    def log_parameters(self, parameters: Dict[str, Any]):
+        """Log multiple parameters to the experiment.
+
+        This method will overwrite existing keys. The ``last_updated`` timestamp is
+        only refreshed once for the whole batch.
+
+        Parameters
+        ----------
+        parameters : dict
+            A dictionary with the parameter name as the key and the parameter as the value.
+        """
+        self.last_updated = datetime.now()
+        self.parameters.update(parameters)
+
     def tag(self, *args, overwrite: bool = False):
         """Add one or more tags to the experiment.
 
@@ -226,11 +356,10 @@ class Experiment:
             Whether to add or overwrite the new tags.
         """
         self.last_updated = datetime.now()
-        new_tags_ = list(args)
         if overwrite:
-            self.tags = new_tags_
+            self.tags = list(args)
         else:
-            self.tags += new_tags_
+            self.tags.extend(args)
 
     def log_artifact(
         self,
@@ -269,6 +398,21 @@ class Experiment:
             Raised if an artifact is supplied with the same name as an existing artifact and
             ``overwrite`` is set to ``False``.
         """
+        # Check for an existing artifact before constructing the handler
+        index = next(
+            (
+                idx
+                for idx, artifact in enumerate(self.artifacts)
+                if artifact.name == name
+            ),
+            None,
+        )
+        if index is not None and not overwrite:
+            raise RuntimeError(
+                f"An artifact with name {name} already exists in the experiment. Please "
+                "use another name or set ``overwrite=True`` to replace the artifact."
+            )
+
         # Retrieve and construct the handler
         self.last_updated = datetime.now()
         handler_cls = _get_handler(handler)
@@ -279,30 +423,69 @@ class Experiment:
             created_at=self.last_updated,
             writer_kwargs=kwargs,
         )
-        for index, artifact in enumerate(self.artifacts):
-            if artifact.name == name:
-                if overwrite:
-                    self.artifacts[index] = artifact_handler
-                    if handler_cls.output_only:
-                        warnings.warn(
-                            f"Artifact '{name}' is added. It is not meant to be read back as Python Object",
-                            UserWarning,
-                            stacklevel=2,
-                        )
-                    break
-                else:
-                    raise RuntimeError(
-                        f"An artifact with name {name} already exists in the experiment. Please "
-                        "use another name or set ``overwrite=True`` to replace the artifact."
-                    )
-        else:
+        if index is None:
             self.artifacts.append(artifact_handler)
-            if handler_cls.output_only:
-                warnings.warn(
-                    f"Artifact '{name}' is added. It is not meant to be read back as Python Object",
-                    UserWarning,
-                    stacklevel=2,
-                )
+        else:
+            self.artifacts[index] = artifact_handler
+        if handler_cls.output_only:
+            warnings.warn(
+                f"Artifact '{name}' is added. It is not meant to be read back as Python Object",
+                UserWarning,
+                stacklevel=2,
+            )
+
+    def _get_read_handler(self, name: str, validate: bool) -> Tuple[Artifact, Artifact]:
+        """Find an artifact and construct a handler for reading it.
+
+        Parameters
+        ----------
+        name : str
+            The name of the artifact.
+        validate : bool
+            Whether or not to validate the runtime environment against the artifact
+            metadata.
+
+        Returns
+        -------
+        Artifact
+            The artifact logged to the experiment.
+        Artifact
+            A handler constructed in the current runtime environment.
+
+        Raises
+        ------
+        ValueError
+            Raised if there is no artifact with the supplied name.
+        RuntimeError
+            Raised if ``validate`` is ``True`` and the current runtime environment does
+            not match the artifact metadata.
+        """
+        try:
+            artifact = next(
+                artifact for artifact in self.artifacts if artifact.name == name
+            )
+        except StopIteration:
+            raise ValueError(f"No artifact with name {name}") from None
+
+        # Construct the handler with relevant parameters.
+        artifact_attrs = {
+            param: getattr(artifact, param)
+            for param in _artifact_construct_params(type(artifact))
+            if hasattr(artifact, param)
+        }
+
+        curr_handler = type(artifact).construct(**artifact_attrs)
+
+        # Validate the handler
+        if validate and curr_handler != artifact:
+            raise RuntimeError(
+                "Runtime environments do not match. Artifact parameters:\n\n"
+                f"{json.dumps(_artifact_environment(artifact))}"
+                "\n\nCurrent parameters:\n\n"
+                f"{json.dumps(_artifact_environment(curr_handler))}"
+            )
+
+        return artifact, curr_handler
 
     def load_artifact(self, name: str, validate: bool = True, **kwargs) -> Any:
         """Load a single artifact.
@@ -322,55 +505,95 @@ class Experiment:
         object
             The artifact.
         """
-        for artifact in self.artifacts:
-            if artifact.name == name:
-                # Construct the handler with relevant parameters.
-                artifact_attrs = {
-                    x: y
-                    for x, y in inspect.getmembers(artifact)
-                    if not x.startswith("_") and not inspect.ismethod(y)
-                }
-                exclude_params = ["value", "fname", "created_at"]
-                construct_params = [
-                    param
-                    for param in inspect.signature(artifact.construct).parameters
-                    if param not in exclude_params
-                ]
-                artifact_attrs = {
-                    key: value
-                    for key, value in artifact_attrs.items()
-                    if key in construct_params
-                }
-
-                curr_handler = type(artifact).construct(**artifact_attrs)
-
-                # Validate the handler
-                if validate and curr_handler != artifact:
-                    field_filters = filters.exclude(
-                        fields(type(artifact)).name,
-                        fields(type(artifact)).fname,
-                        fields(type(artifact)).value,
-                        fields(type(artifact)).created_at,
-                    )
-                    raise RuntimeError(
-                        "Runtime environments do not match. Artifact parameters:\n\n"
-                        f"{json.dumps(asdict(artifact, filter=field_filters))}"
-                        "\n\nCurrent parameters:\n\n"
-                        f"{json.dumps(asdict(curr_handler, filter=field_filters))}"
-                    )
-                # Read in the artifact
-                mode = "rb" if curr_handler.binary else "r"
-                with self.fs.open(self.dir / self.path / artifact.fname, mode) as buf:
-                    out = curr_handler.read(buf, **kwargs)
-                if artifact.output_only:
-                    warnings.warn(
-                        f"Artifact '{name}' is not the original Python Object",
-                        UserWarning,
-                        stacklevel=2,
-                    )
-                break
+        artifact, curr_handler = self._get_read_handler(name, validate)
+
+        # Read in the artifact
+        mode = "rb" if curr_handler.binary else "r"
+        with self.fs.open(self.dir / self.path / artifact.fname, mode) as buf:
+            out = curr_handler.read(buf, **kwargs)
+        if artifact.output_only:
+            warnings.warn(
+                f"Artifact '{name}' is not the original Python Object",
+                UserWarning,
+                stacklevel=2,
+            )
+
+        return out
+
+    def load_artifacts(
+        self, names: Optional[List[str]] = None, validate: bool = True, **kwargs
+    ) -> Dict[str, Any]:
+        """Load multiple artifacts.
+
+        The raw contents of every artifact are fetched with a single call to the
+        filesystem's ``cat_ranges`` method. For asynchronous ``fsspec`` implementations
+        (e.g. S3 or GCS) this issues the reads concurrently rather than one round-trip
+        per artifact. Filesystems without ``cat_ranges`` read the artifacts one at a
+        time.
+
+        .. important::
+
+            The contents of every requested artifact are held in memory before they
+            are deserialized.
+
+        Parameters
+        ----------
+        names : list, optional (default None)
+            The names of the artifacts to load. If not provided, every artifact associated
+            with the experiment will be loaded.
+        validate : bool, optional (default True)
+            Whether or not to validate the runtime environment against the artifact
+            metadata.
+        **kwargs : dict
+            Keyword arguments for the read function of every handler.
+
+        Returns
+        -------
+        dict
+            A dictionary with the artifact name as the key and the artifact as the value.
+        """
+        if names is None:
+            names = [artifact.name for artifact in self.artifacts]
+        handlers = {name: self._get_read_handler(name, validate) for name in names}
+        artifact_dir = self.dir / self.path
+        fpaths = [
+            str(artifact_dir / artifact.fname) for artifact, _ in handlers.values()
+        ]
+        contents: List[Any]
+        if not fpaths:
+            contents = []
+        elif hasattr(self.fs, "cat_ranges"):
+            # ``cat_ranges`` preserves the input order and, unlike ``cat``, does not
+            # treat the paths as glob patterns
+            contents = self.fs.cat_ranges(
+                fpaths, [None] * len(fpaths), [None] * len(fpaths)
+            )
         else:
-            raise ValueError(f"No artifact with name {name}")
+            # Older ``fsspec`` releases do not have ``cat_ranges``
+            contents = []
+            for fpath in fpaths:
+                with self.fs.open(fpath, "rb") as infile:
+                    contents.append(infile.read())
+
+        out: Dict[str, Any] = {}
+        for (name, (artifact, curr_handler)), content in zip(
+            handlers.items(), contents
+        ):
+            # Newer ``fsspec`` releases return read errors in place of the contents
+            if isinstance(content, Exception):
+                raise content
+            buf = io.BytesIO(content)
+            if curr_handler.binary:
+                out[name] = curr_handler.read(buf, **kwargs)
+            else:
+                with io.TextIOWrapper(buf) as text:
+                    out[name] = curr_handler.read(text, **kwargs)
+            if artifact.output_only:
+                warnings.warn(
+                    f"Artifact '{name}' is not the original Python Object",
+                    UserWarning,
+                    stacklevel=2,
+                )
 
         return out
 
@@ -408,20 +631,49 @@ class Experiment:
         Dict
             The experiment dictionary.
         """
-        return asdict(
-            self,
-            value_serializer=serializer,
-            filter=filters.exclude(
-                fields(Experiment).dir,
-                fields(Experiment).project,
-                fields(Experiment).fs,
-            ),
-        )
+        return {
+            "name": self.name,
+            "author": self.author,
+            "last_updated_by": self.last_updated_by,
+            "metrics": _serialize_value(self.metrics),
+            "parameters": _serialize_value(self.parameters),
+            "created_at": self.created_at.isoformat(timespec="seconds"),
+            "last_updated": self.last_updated.isoformat(timespec="seconds"),
+            "dependencies": [
+                f"{exp.project}|{exp.slug}" for exp in self.dependencies.values()
+            ],
+            "short_slug": self.short_slug,
+            "slug": self.slug,
+            "tests": [test.to_dict() for test in self.tests],
+            "artifacts": [artifact.to_dict() for artifact in self.artifacts],
+            "tags": list(self.tags),
+        }
 
     def __str__(self):
         """Shortened string representation."""
         return f"<lazyscribe.experiment.Experiment at {hex(id(self))}>"
 
+    def _comparison_values(self, other) -> Tuple[datetime, datetime]:
+        """Get the timestamps used to order this experiment against another.
+
+        Parameters
+        ----------
+        other : Experiment
+            The experiment to compare against.
+
+        Returns
+        -------
+        datetime
+            The ``last_updated`` value for this experiment if the slugs match, otherwise
+            the ``created_at`` value.
+        datetime
+            The matching value for ``other``.
+        """
+        if self.slug == other.slug:
+            return self.last_updated, other.last_updated
+
+        return self.created_at, other.created_at
+
     def __gt__(self, other):
         """Determine whether this experiment is newer than another experiment.
 
@@ -429,10 +681,9 @@ class Experiment:
         ``last_updated`` attribute. If the ``slug`` is different, this function will use
         the ``created_at`` value.
         """
-        if self.slug == other.slug:
-            return self.last_updated > other.last_updated
-        else:
-            return self.created_at > other.created_at
+        left, right = self._comparison_values(other)
+
+        return left > right
 
     def __lt__(self, other):
         """Determine whether this experiment is older than another experiment.
@@ -441,10 +692,9 @@ class Experiment:
         ``last_updated`` attribute. If the ``slug`` is different, this function will use
         the ``created_at`` value.
         """
-        if self.slug == other.slug:
-            return self.last_updated < other.last_updated
-        else:
-            return self.created_at < other.created_at
+        left, right = self._comparison_values(other)
+
+        return left < right
 
     def __ge__(self, other):
         """Determine whether this experiment is newer than another experiment.
@@ -453,7 +703,9 @@ class Experiment:
         ``last_updated`` attribute. If the ``slug`` is different, this function will use
         the ``created_at`` value.
         """
-        return bool(self == other or self > other)
+        left, right = self._comparison_values(other)
+
+        return left >= right
 
     def __le__(self, other):
         """Determine whether this experiment is older than another experiment.
@@ -462,10 +714,12 @@ class Experiment:
         ``last_updated`` attribute. If the ``slug`` is different, this function will use
         the ``created_at`` value.
         """
-        return bool(self == other or self < other)
+        left, right = self._comparison_values(other)
+
+        return left <= right
 
 
-@frozen
+@frozen(slots=True)
 class ReadOnlyExperiment(Experiment):
     """Immutable version of an experiment."""
 
@@ -8,10 +8,10 @@ from __future__ import annotations
 
 from typing import Any, List
 
-from attrs import define
+from attrs import define, field
 
 
-@define
+@define(weakref_slot=False)
 class Node:
     """Node for the linked list.
 
@@ -34,15 +34,23 @@ class Node:
         list
             A standard list.
         """
-        out = []
-        while self.next:
-            out.append(self.data)
-            self = self.next
-        out.append(self.data)
+        out: List[Any] = []
+        append = out.append
+        node = self
+        while node is not None:
+            append(node.data)
+            node = node.next
 
         return out
 
 
+def _reset_tail(instance: LinkedList, attribute: Any, value: Any) -> Any:
+    """Forget the cached tail when the head of a linked list is replaced."""
+    instance.tail = None
+
+    return value
+
+
 @define
 class LinkedList:
     """The linked list.
@@ -51,9 +59,16 @@ class LinkedList:
     ----------
     head : any, optional (default None)
         The start of the list.
+
+    Attributes
+    ----------
+    tail : any
+        The last node appended to the list. Used to avoid walking the list on every
+        :py:meth:`LinkedList.append` call.
     """
 
-    head: Any = None
+    head: Any = field(default=None, on_setattr=_reset_tail)
+    tail: Any = field(default=None, init=False, eq=False, repr=False)
 
     def append(self, data: Any):
         """Append a new node to the end of the list.
@@ -65,22 +80,28 @@ class LinkedList:
         """
         new = Node(data=data)
         if self.head:
-            # Scroll to the end of the list
-            current = self.head
+            current = self.tail or self.head
+            # Scroll to the end, in case nodes were chained outside of ``append``
             while current.next:
                 current = current.next
             current.next = new
         else:
             self.head = new
+        self.tail = new
 
     @staticmethod
     def from_list(data: List) -> LinkedList:
         """Convert a standard list to a linked list."""
         # Sort the list
         sorted_list = sorted(data)
-        out = LinkedList()
-        for val in sorted_list:
-            out.append(val)
+        # Chain the nodes from the end so the sort stays stable
+        head = tail = None
+        for val in reversed(sorted_list):
+            head = Node(data=val, next=head)
+            if tail is None:
+                tail = head
+        out = LinkedList(head=head)
+        out.tail = tail
 
         return out
 
@@ -6,7 +6,9 @@ from lazyscribe.prefect.experiment import (
     LazyExperiment,
     append_test,
     log_experiment_metric,
+    log_experiment_metrics,
     log_parameter,
+    log_parameters,
 )
 from lazyscribe.prefect.project import (
     LazyProject,
@@ -14,7 +16,7 @@ from lazyscribe.prefect.project import (
     merge_projects,
     save_project,
 )
-from lazyscribe.prefect.test import LazyTest, log_test_metric
+from lazyscribe.prefect.test import LazyTest, log_test_metric, log_test_metrics
 
 __all__: List[str] = [
     "LazyExperiment",
@@ -23,8 +25,11 @@ __all__: List[str] = [
     "append_experiment",
     "append_test",
     "log_experiment_metric",
+    "log_experiment_metrics",
     "log_parameter",
+    "log_parameters",
     "log_test_metric",
+    "log_test_metrics",
     "merge_projects",
     "save_project",
 ]
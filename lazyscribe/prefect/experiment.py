@@ -1,20 +1,19 @@
 """Prefect experiment tasks."""
 
-import getpass
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterator, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import prefect
 from prefect import Flow, Task, task
 from prefect.utilities.tasks import defaults_from_attrs
 
-from lazyscribe.experiment import Experiment
+from lazyscribe.experiment import Experiment, _default_author
 from lazyscribe.prefect.test import LazyTest
 from lazyscribe.test import Test
 
 
-@task(name="Log experiment metric")
+@task(name="Log experiment metric", checkpoint=False)
 def log_experiment_metric(experiment: Experiment, name: str, value: Union[float, int]):
     """Log a metric.
 
@@ -30,7 +29,21 @@ def log_experiment_metric(experiment: Experiment, name: str, value: Union[float,
     experiment.log_metric(name, value)
 
 
-@task(name="Log parameter")
+@task(name="Log experiment metrics", checkpoint=False)
+def log_experiment_metrics(experiment: Experiment, metrics: Dict):
+    """Log multiple metrics.
+
+    Parameters
+    ----------
+    experiment : Experiment
+        The experiment.
+    metrics : dict
+        A dictionary of metric names and values.
+    """
+    experiment.log_metrics(metrics)
+
+
+@task(name="Log parameter", checkpoint=False)
 def log_parameter(experiment: Experiment, name: str, value: Any):
     """Log a parameter.
 
@@ -46,7 +59,21 @@ def log_parameter(experiment: Experiment, name: str, value: Any):
     experiment.log_parameter(name, value)
 
 
-@task(name="Log artifact")
+@task(name="Log parameters", checkpoint=False)
+def log_parameters(experiment: Experiment, parameters: Dict):
+    """Log multiple parameters.
+
+    Parameters
+    ----------
+    experiment : Experiment
+        The experiment.
+    parameters : dict
+        A dictionary of parameter names and values.
+    """
+    experiment.log_parameters(parameters)
+
+
+@task(name="Log artifact", checkpoint=False)
 def log_artifact(
     experiment: Experiment,
     name: str,
@@ -103,7 +130,7 @@ def load_artifact(experiment: Experiment, name: str, validate: bool = True, **kw
     return experiment.load_artifact(name, validate, **kwargs)
 
 
-@task(name="Append test")
+@task(name="Append test", checkpoint=False)
 def append_test(experiment: Experiment, test: Test):
     """Append a test to the experiment.
 
@@ -117,7 +144,7 @@ def append_test(experiment: Experiment, test: Test):
     experiment.tests.append(test)
 
 
-@task(name="Add tag")
+@task(name="Add tag", checkpoint=False)
 def add_tag(experiment: Experiment, tags: Tuple[str], overwrite: bool):
     """Add tags to the experiment.
 
@@ -151,7 +178,7 @@ class LazyExperiment(Task):
     def __init__(
         self,
         project: Optional[Path] = None,
-        author: Optional[str] = getpass.getuser(),
+        author: Optional[str] = _default_author(),
         **kwargs,
     ):
         """Init method."""
@@ -204,6 +231,20 @@ class LazyExperiment(Task):
         """
         log_experiment_metric(self, name, value)
 
+    def log_metrics(self, metrics: Dict):
+        """Add a ``log_experiment_metrics`` task.
+
+        Use this method instead of repeated calls to
+        :py:meth:`lazyscribe.prefect.LazyExperiment.log_metric` to add a single task
+        to the flow.
+
+        Parameters
+        ----------
+        metrics : dict
+            A dictionary of metric names and values.
+        """
+        log_experiment_metrics(self, metrics)
+
     def log_parameter(self, name: str, value: Any):
         """Add a ``log_parameter`` task.
 
@@ -216,6 +257,20 @@ class LazyExperiment(Task):
         """
         log_parameter(self, name, value)
 
+    def log_parameters(self, parameters: Dict):
+        """Add a ``log_parameters`` task.
+
+        Use this method instead of repeated calls to
+        :py:meth:`lazyscribe.prefect.LazyExperiment.log_parameter` to add a single
+        task to the flow.
+
+        Parameters
+        ----------
+        parameters : dict
+            A dictionary of parameter names and values.
+        """
+        log_parameters(self, parameters)
+
     def tag(self, *args, overwrite: bool = False):
         """Add a ``add_tag`` task.
 
@@ -303,13 +358,13 @@ class LazyExperiment(Task):
             An instantiated :py:class:`lazyscribe.prefect.LazyTest` object. This task
             has already been added to the flow.
         """
+        flow = flow or prefect.context.get("flow")
+        if not flow:
+            raise ValueError("Could not infer an active flow context.")
+
         test = LazyTest(name=name, description=description)()
 
         try:
             yield test
         finally:
-            flow = flow or prefect.context.get("flow")
-            if not flow:
-                raise ValueError("Could not infer an active flow context.")
-
             append_test(self, test, upstream_tasks=flow.downstream_tasks(test))
@@ -1,6 +1,7 @@
 """Prefect project tasks."""
 
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union
 from urllib.parse import urlparse
@@ -14,7 +15,26 @@ from lazyscribe.prefect.experiment import LazyExperiment
 from lazyscribe.project import Project
 
 
-@task(name="Append experiment")
+@lru_cache(maxsize=8)
+def _to_path(fpath: str) -> Path:
+    """Convert a project location to a path without the filesystem protocol.
+
+    Parameters
+    ----------
+    fpath : str
+        The location of the project JSON.
+
+    Returns
+    -------
+    Path
+        The project location.
+    """
+    parsed = urlparse(fpath)
+
+    return Path(parsed.netloc + parsed.path)
+
+
+@task(name="Append experiment", checkpoint=False)
 def append_experiment(project: Project, experiment: Experiment):
     """Append an experiment to an existing project.
 
@@ -28,7 +48,7 @@ def append_experiment(project: Project, experiment: Experiment):
     project.append(experiment)
 
 
-@task(name="Save project")
+@task(name="Save project", checkpoint=False)
 def save_project(project: Project):
     """Save the project.
 
@@ -260,18 +280,20 @@ class LazyProject(Task):
         # Convert string to Path, if necessary
         if project is None:
             if isinstance(self.fpath, str):
-                parsed = urlparse(self.fpath)
-                fpath = Path(parsed.netloc + parsed.path)
+                fpath = _to_path(self.fpath)
             else:
                 fpath = self.fpath
         elif isinstance(project, str):
-            parsed = urlparse(project)
-            fpath = Path(parsed.netloc + parsed.path)
+            fpath = _to_path(project)
         elif isinstance(project, (Path, Parameter)):
             fpath = project  # type: ignore
         else:
             raise ValueError("Please supply a valid project value.")
 
+        flow = flow or prefect.context.get("flow")
+        if not flow:
+            raise ValueError("Could not infer an active flow context.")
+
         experiment = LazyExperiment(name=name)(
             project=fpath, author=author or self.author, upstream_tasks=[self]
         )
@@ -279,8 +301,4 @@ class LazyProject(Task):
         try:
             yield experiment
         finally:
-            flow = flow or prefect.context.get("flow")
-            if not flow:
-                raise ValueError("Could not infer an active flow context.")
-
             self.append(experiment, upstream_tasks=flow.downstream_tasks(experiment))
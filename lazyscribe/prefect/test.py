@@ -1,6 +1,6 @@
 """Prefect test tasks."""
 
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from prefect import Task, task
 from prefect.utilities.tasks import defaults_from_attrs
@@ -8,7 +8,7 @@ from prefect.utilities.tasks import defaults_from_attrs
 from lazyscribe.test import Test
 
 
-@task(name="Log test metric")
+@task(name="Log test metric", checkpoint=False)
 def log_test_metric(test: Test, name: str, value: Union[float, int]):
     """Log a non-global metric to a test.
 
@@ -24,7 +24,21 @@ def log_test_metric(test: Test, name: str, value: Union[float, int]):
     test.log_metric(name, value)
 
 
-@task(name="Log test parameter")
+@task(name="Log test metrics", checkpoint=False)
+def log_test_metrics(test: Test, metrics: Dict):
+    """Log multiple non-global metrics to a test.
+
+    Parameters
+    ----------
+    test : Test
+        The instantiated :py:class:`lazyscribe.test.Test` object.
+    metrics : dict
+        A dictionary of metric names and values.
+    """
+    test.log_metrics(metrics)
+
+
+@task(name="Log test parameter", checkpoint=False)
 def log_test_parameter(test: Test, name: str, value: Any):
     """Log a non-global parameter to a test.
 
@@ -40,6 +54,20 @@ def log_test_parameter(test: Test, name: str, value: Any):
     test.log_parameter(name, value)
 
 
+@task(name="Log test parameters", checkpoint=False)
+def log_test_parameters(test: Test, parameters: Dict):
+    """Log multiple non-global parameters to a test.
+
+    Parameters
+    ----------
+    test : Test
+        The instantiated :py:class:`lazyscribe.test.Test` object.
+    parameters : dict
+        A dictionary of parameter names and values.
+    """
+    test.log_parameters(parameters)
+
+
 class LazyTest(Task):
     """Prefect integration for logging ``lazyscribe`` tests.
 
@@ -94,6 +122,16 @@ class LazyTest(Task):
         """
         log_test_metric(self, name, value)
 
+    def log_metrics(self, metrics: Dict):
+        """Add a ``log_test_metrics`` task.
+
+        Parameters
+        ----------
+        metrics : dict
+            A dictionary of metric names and values.
+        """
+        log_test_metrics(self, metrics)
+
     def log_parameter(self, name: str, value: Any):
         """Add a ``log_parameter`` task.
 
@@ -105,3 +143,13 @@ class LazyTest(Task):
             The parameter value.
         """
         log_test_parameter(self, name, value)
+
+    def log_parameters(self, parameters: Dict):
+        """Add a ``log_test_parameters`` task.
+
+        Parameters
+        ----------
+        parameters : dict
+            A dictionary of parameter names and values.
+        """
+        log_test_parameters(self, parameters)
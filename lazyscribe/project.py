@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-import getpass
 import json
 import logging
 import warnings
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterator, List, Literal, Tuple
+from typing import Callable, Dict, Iterator, List, Literal, Tuple, Type
 from urllib.parse import urlparse
 
 import fsspec
 
+from lazyscribe._utils import _serialize_value
 from lazyscribe.artifacts import _get_handler
-from lazyscribe.experiment import Experiment, ReadOnlyExperiment
-from lazyscribe.linked import LinkedList, merge
+from lazyscribe.experiment import Experiment, ReadOnlyExperiment, _default_author
 from lazyscribe.test import ReadOnlyTest, Test
 
 LOG = logging.getLogger(__name__)
@@ -85,7 +84,7 @@ class Project:
         if mode in ("r", "a", "w+") and self.fs.isfile(self.fpath):
             self.load()
 
-        self.author = getpass.getuser() if author is None else author
+        self.author = _default_author() if author is None else author
 
     def load(self):
         """Load existing experiments.
@@ -94,20 +93,27 @@ class Project:
         be loaded in read-only mode. If opened in editable mode, existing experiments
         will be loaded in editable mode.
         """
-        with self.fs.open(self.fpath, "r") as infile:
-            data = json.load(infile)
-        for idx, entry in enumerate(data):
-            data[idx]["created_at"] = datetime.fromisoformat(entry["created_at"])
-            data[idx]["last_updated"] = datetime.fromisoformat(entry["last_updated"])
+        with self.fs.open(self.fpath, "rb") as infile:
+            data = json.loads(infile.read())
+
+        exp_cls: Type[Experiment | ReadOnlyExperiment]
+        test_cls: Type[Test | ReadOnlyTest]
+        if self.mode in ("r", "a"):
+            exp_cls, test_cls = ReadOnlyExperiment, ReadOnlyTest
+        else:
+            exp_cls, test_cls = Experiment, Test
 
         parent = self.fpath.parent
         upstream_projects = {}
         for exp in data:
+            exp["created_at"] = datetime.fromisoformat(exp["created_at"])
+            exp["last_updated"] = datetime.fromisoformat(exp["last_updated"])
+
             dependencies = {}
             if "dependencies" in exp:
                 deplist = exp.pop("dependencies")
                 for dep in deplist:
-                    project_name, exp_name = dep.split("|")
+                    project_name, _, exp_name = dep.partition("|")
                     project = upstream_projects.get(project_name)
                     if not project:
                         project = Project(
@@ -115,7 +121,10 @@ class Project:
                             mode="r",
                             **self.storage_options,
                         )
-                        project.load()
+                        if not project.experiments:
+                            # ``Project.__init__`` only loads existing files, so load
+                            # explicitly to raise if the upstream project is missing
+                            project.load()
                         upstream_projects[project_name] = project
                     depexp = project[exp_name]
                     dependencies[depexp.short_slug] = depexp
@@ -124,10 +133,7 @@ class Project:
             if "tests" in exp:
                 testlist = exp.pop("tests")
                 for test in testlist:
-                    if self.mode in ("r", "a"):
-                        tests.append(ReadOnlyTest(**test))
-                    else:
-                        tests.append(Test(**test))
+                    tests.append(test_cls(**test))
 
             artifacts = []
             if "artifacts" in exp:
@@ -139,28 +145,16 @@ class Project:
                         handler_cls.construct(**artifact, created_at=created_at)
                     )
 
-            if self.mode in ("r", "a"):
-                self.experiments.append(
-                    ReadOnlyExperiment(
-                        **exp,
-                        project=self.fpath,
-                        fs=self.fs,
-                        dependencies=dependencies,
-                        tests=tests,
-                        artifacts=artifacts,
-                    )
-                )
-            else:
-                self.experiments.append(
-                    Experiment(
-                        **exp,
-                        project=self.fpath,
-                        fs=self.fs,
-                        dependencies=dependencies,
-                        tests=tests,
-                        artifacts=artifacts,
-                    )
+            self.experiments.append(
+                exp_cls(
+                    **exp,
+                    project=self.fpath,
+                    fs=self.fs,
+                    dependencies=dependencies,
+                    tests=tests,
+                    artifacts=artifacts,
                 )
+            )
             self.snapshot[self.experiments[-1].slug] = self.experiments[-1].last_updated
 
     def save(self):
@@ -171,15 +165,23 @@ class Project:
         if self.mode == "r":
             raise RuntimeError("Project is in read-only mode.")
         elif self.mode == "w+":
+            # Index the experiments once instead of scanning the list for every
+            # snapshot entry. The first experiment matching a slug or short slug wins,
+            # consistent with ``__getitem__``
+            index: Dict[str, Experiment | ReadOnlyExperiment] = {}
+            for exp in self.experiments:
+                index.setdefault(exp.slug, exp)
+                index.setdefault(exp.short_slug, exp)
             for slug, last_updated in self.snapshot.items():
-                if slug not in self:
+                exp = index.get(slug)
+                if exp is None:
                     continue
-                if self[slug].last_updated > last_updated:
-                    self[slug].last_updated_by = self.author
+                if exp.last_updated > last_updated:
+                    exp.last_updated_by = self.author
 
         data = list(self)
         with self.fs.open(self.fpath, "w") as outfile:
-            json.dump(data, outfile, sort_keys=True, indent=4)
+            outfile.write(json.dumps(data, sort_keys=True, indent=4))
 
         for exp in self.experiments:
             if isinstance(exp, ReadOnlyExperiment):
@@ -193,9 +195,10 @@ class Project:
                 continue
             # Write the artifact data
             LOG.info(f"Saving artifacts for {exp.slug}")
+            artifact_dir = exp.dir / exp.path
             for artifact in exp.artifacts:
                 fmode = "wb" if artifact.binary else "w"
-                fpath = exp.dir / exp.path / artifact.fname
+                fpath = artifact_dir / artifact.fname
                 if self.fs.isfile(
                     fpath
                 ) and artifact.created_at <= datetime.fromtimestamp(
@@ -206,7 +209,7 @@ class Project:
                     )
                     continue
 
-                self.fs.makedirs(exp.dir / exp.path, exist_ok=True)
+                self.fs.makedirs(artifact_dir, exist_ok=True)
                 LOG.debug(f"Saving '{artifact.name}' to {fpath!s}...")
                 with self.fs.open(fpath, fmode) as buf:
                     artifact.write(artifact.value, buf, **artifact.writer_kwargs)
@@ -230,13 +233,30 @@ class Project:
         Project
             A new project.
         """
-        # Create linked lists of experiments
-        cexp = LinkedList.from_list(self.experiments)
-        oexp = LinkedList.from_list(other.experiments)
-        # Get the merged list of experiments
-        merged = merge(cexp.head, oexp.head).to_list()
-        # De-dupe the merged list based on slug
-        slugs = [exp.slug for exp in merged]
+        # Sort each project and merge the two lists. Experiment ordering is not
+        # transitive, so the lists cannot be sorted together. Take from the current
+        # project only when it is strictly older so that ties go to the other project
+        current = sorted(self.experiments)
+        incoming = sorted(other.experiments)
+        merged = []
+        cidx = oidx = 0
+        while cidx < len(current) and oidx < len(incoming):
+            if current[cidx] < incoming[oidx]:
+                merged.append(current[cidx])
+                cidx += 1
+            else:
+                merged.append(incoming[oidx])
+                oidx += 1
+        merged.extend(current[cidx:])
+        merged.extend(incoming[oidx:])
+        # De-dupe the merged list based on slug, keeping the last occurrence
+        seen = set()
+        deduped = []
+        for exp in reversed(merged):
+            if exp.slug not in seen:
+                seen.add(exp.slug)
+                deduped.append(exp)
+        deduped.reverse()
 
         new = Project(
             fpath=self.fpath,
@@ -244,9 +264,7 @@ class Project:
             author=self.author,
             **self.storage_options,
         )
-        new.experiments = [
-            val for idx, val in enumerate(merged) if val.slug not in slugs[idx + 1 :]
-        ]
+        new.experiments = deduped
 
         return new
 
@@ -384,41 +402,47 @@ class Project:
         exp_output: List = []
         test_output: List = []
 
-        for exp in self:
+        for exp in self.experiments:
+            # Only serialize the fields needed for the table, not the full experiment
+            name, short_slug, slug = exp.name, exp.short_slug, exp.slug
             exp_output.append(
                 {
-                    ("name", ""): exp["name"],
-                    ("short_slug", ""): exp["short_slug"],
-                    ("slug", ""): exp["slug"],
-                    ("author", ""): exp["author"],
-                    ("last_updated_by", ""): exp["last_updated_by"],
-                    ("created_at", ""): exp["created_at"],
-                    ("last_updated", ""): exp["last_updated"],
+                    ("name", ""): name,
+                    ("short_slug", ""): short_slug,
+                    ("slug", ""): slug,
+                    ("author", ""): exp.author,
+                    ("last_updated_by", ""): exp.last_updated_by,
+                    ("created_at", ""): exp.created_at.isoformat(timespec="seconds"),
+                    ("last_updated", ""): exp.last_updated.isoformat(
+                        timespec="seconds"
+                    ),
                     **{
-                        ("metrics", key): value for key, value in exp["metrics"].items()
+                        ("metrics", key): value
+                        for key, value in _serialize_value(exp.metrics).items()
                     },
                     **{
                         ("parameters", key): value
-                        for key, value in exp["parameters"].items()
+                        for key, value in _serialize_value(exp.parameters).items()
                         if not isinstance(value, (tuple, list, dict))
                     },
                 }
             )
-            for test in exp["tests"]:
+            for test in exp.tests:
+                test_dict = test.to_dict()
                 test_output.append(
                     {
-                        ("experiment_name", ""): exp["name"],
-                        ("experiment_short_slug", ""): exp["short_slug"],
-                        ("experiment_slug", ""): exp["slug"],
-                        ("test", ""): test["name"],
-                        ("description", ""): test["description"],
+                        ("experiment_name", ""): name,
+                        ("experiment_short_slug", ""): short_slug,
+                        ("experiment_slug", ""): slug,
+                        ("test", ""): test_dict["name"],
+                        ("description", ""): test_dict["description"],
                         **{
                             ("metrics", key): value
-                            for key, value in test["metrics"].items()
+                            for key, value in test_dict["metrics"].items()
                         },
                         **{
                             ("parameters", key): value
-                            for key, value in test["parameters"].items()
+                            for key, value in test_dict["parameters"].items()
                             if not isinstance(value, (tuple, list, dict))
                         },
                     }
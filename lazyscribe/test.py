@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional, Union
 
 from attrs import Factory, define, frozen
 
+from lazyscribe._utils import _serialize_value
+
 
 @define
 class Test:
@@ -30,8 +32,8 @@ class Test:
 
     name: str
     description: Optional[str] = Factory(lambda: None)
-    metrics: Dict = Factory(lambda: {})
-    parameters: Dict = Factory(lambda: {})
+    metrics: Dict = Factory(dict)
+    parameters: Dict = Factory(dict)
 
     def log_metric(self, name: str, value: Union[float, int]):
         """Log a metric to the test.
@@ -47,6 +49,33 @@ class Test:
         """
         self.metrics[name] = value
 
+    def log_metrics(self, metrics: Dict[str, Union[float, int]]):
+        """Log multiple metrics to the test.
+
+        This method will overwrite existing keys.
+
+        Parameters
+        ----------
+        metrics : dict
+            A dictionary with the metric name as the key and the metric value as the value.
+        """
+        self.metrics.update(metrics)
+
+    def to_dict(self) -> Dict:
+        """Serialize the test to a dictionary.
+
+        Returns
+        -------
+        Dict
+            The test dictionary.
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "metrics": _serialize_value(self.metrics),
+            "parameters": _serialize_value(self.parameters),
+        }
+
     def __str__(self):
         """Shortened string representation."""
         return f"<lazyscribe.test.Test at {hex(id(self))}>"
@@ -65,6 +94,18 @@ class Test:
         """
         self.parameters[name] = value
 
+    def log_parameters(self, parameters: Dict[str, Any]):
+        """Log multiple parameters to the test.
+
+        This method will overwrite existing keys.
+
+        Parameters
+        ----------
+        parameters : dict
+            A dictionary with the parameter name as the key and the parameter as the value.
+        """
+        self.parameters.update(parameters)
+
 
 @frozen
 class ReadOnlyTest(Test):
@@ -4,12 +4,13 @@ import sys
 import warnings
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 from attrs.exceptions import FrozenInstanceError
 
 from lazyscribe.artifacts import _get_handler
-from lazyscribe.experiment import Experiment, ReadOnlyExperiment
+from lazyscribe.experiment import Experiment, ReadOnlyExperiment, serializer
 from lazyscribe.test import ReadOnlyTest, Test
 
 
@@ -25,6 +26,44 @@ def test_attrs_default():
     assert "lazyscribe.experiment.Experiment" in str(exp)
 
 
+def test_experiment_logging_multiple():
+    """Test logging multiple metrics and parameters at once."""
+    exp = Experiment(name="My experiment", project=Path("project.json"))
+    exp.log_metric("name", 0.1)
+    exp.log_metrics({"name": 0.5, "name-cv": 0.4})
+    exp.log_parameters({"features": ["col1", "col2"], "target": "y"})
+
+    assert exp.metrics == {"name": 0.5, "name-cv": 0.4}
+    assert exp.parameters == {"features": ["col1", "col2"], "target": "y"}
+
+
+def test_author_interned():
+    """Test that author strings are shared between experiments."""
+    first = Experiment(
+        name="My experiment", project=Path("project.json"), author="".join(["ro", "ot"])
+    )
+    second = Experiment(
+        name="My experiment", project=Path("project.json"), author="".join(["ro", "ot"])
+    )
+
+    assert first.author is second.author
+    assert first.last_updated_by is first.author
+
+
+def test_slug_interned():
+    """Test that slugs are shared between experiments."""
+    created_at = datetime(2022, 1, 1, 9, 30, 0)
+    first = Experiment(
+        name="My experiment", project=Path("project.json"), created_at=created_at
+    )
+    second = Experiment(
+        name="My experiment", project=Path("project.json"), created_at=created_at
+    )
+
+    assert first.short_slug is second.short_slug
+    assert first.slug is second.slug
+
+
 def test_experiment_logging():
     """Test logging metrics and parameters."""
     exp = Experiment(name="My experiment", project=Path("project.json"))
@@ -57,6 +96,17 @@ def test_experiment_logging():
     assert exp.tags == ["actually a failure"]
 
 
+def test_experiment_log_test_multiple():
+    """Test logging multiple metrics and parameters to a test."""
+    exp = Experiment(name="My experiment", project=Path("project.json"), author="root")
+    with exp.log_test(name="My test") as test:
+        test.log_metrics({"name-subpop": 0.3, "other-subpop": 0.4})
+        test.log_parameters({"param": "value"})
+
+    assert exp.tests[0].metrics == {"name-subpop": 0.3, "other-subpop": 0.4}
+    assert exp.tests[0].parameters == {"param": "value"}
+
+
 def test_experiment_serialization():
     """Test serializing the experiment to a dictionary."""
     today = datetime.now()
@@ -89,6 +139,25 @@ def test_experiment_serialization():
     }
 
 
+def test_experiment_serialization_nested_datetime():
+    """Test serializing datetime values nested in the experiment parameters."""
+    exp = Experiment(name="My experiment", project=Path("project.json"), author="root")
+    exp.log_parameter("cutoff", datetime(2023, 1, 1))
+    exp.log_parameter(
+        "windows", {"train": [datetime(2022, 1, 1), datetime(2022, 6, 1)]}
+    )
+
+    out = exp.to_dict()
+
+    assert out["parameters"] == {
+        "cutoff": "2023-01-01T00:00:00",
+        "windows": {"train": ["2022-01-01T00:00:00", "2022-06-01T00:00:00"]},
+    }
+    # The output should not share containers with the experiment
+    out["parameters"]["windows"]["train"].append("2023-01-01T00:00:00")
+    assert len(exp.parameters["windows"]["train"]) == 2
+
+
 def test_experiment_artifact_logging_basic():
     """Test logging an artifact to the experiment."""
     today = datetime.now()
@@ -160,6 +229,63 @@ def test_experiment_artifact_load(tmp_path):
     assert out == [0, 1, 2]
 
 
+def test_experiment_artifact_load_multiple(tmp_path):
+    """Test loading multiple experiment artifacts from the disk."""
+    location = tmp_path / "my-location"
+    location.mkdir()
+
+    exp = Experiment(
+        name="My experiment", project=location / "project.json", author="root"
+    )
+    exp.log_artifact(name="features", value=[0, 1, 2], handler="json")
+    exp.log_artifact(name="target", value={"name": "y"}, handler="json")
+    # Need to write the artifacts to disk
+    exp.fs.makedirs(exp.dir / exp.path, exist_ok=True)
+    for artifact in exp.artifacts:
+        with exp.fs.open(exp.dir / exp.path / artifact.fname, "w") as buf:
+            artifact.write(artifact.value, buf)
+
+    assert exp.load_artifacts() == {"features": [0, 1, 2], "target": {"name": "y"}}
+    assert exp.load_artifacts(names=["target"]) == {"target": {"name": "y"}}
+
+    with pytest.raises(ValueError):
+        exp.load_artifacts(names=["features", "model"])
+
+    # Paths with glob characters should not be expanded
+    location = tmp_path / "run[1]"
+    location.mkdir()
+
+    exp = Experiment(
+        name="My experiment", project=location / "project.json", author="root"
+    )
+    exp.log_artifact(name="features", value=[0, 1, 2], handler="json")
+    exp.fs.makedirs(exp.dir / exp.path, exist_ok=True)
+    for artifact in exp.artifacts:
+        with exp.fs.open(exp.dir / exp.path / artifact.fname, "w") as buf:
+            artifact.write(artifact.value, buf)
+
+    assert exp.load_artifacts() == {"features": [0, 1, 2]}
+
+    # Filesystems without ``cat_ranges`` should read the artifacts one at a time
+    exp.fs = Mock(spec=["open"], open=exp.fs.open)
+
+    assert exp.load_artifacts() == {"features": [0, 1, 2]}
+
+
+def test_experiment_artifact_load_multiple_missing(tmp_path):
+    """Test loading multiple artifacts when a file is missing from the disk."""
+    location = tmp_path / "my-location"
+    location.mkdir()
+
+    exp = Experiment(
+        name="My experiment", project=location / "project.json", author="root"
+    )
+    exp.log_artifact(name="features", value=[0, 1, 2], handler="json")
+
+    with pytest.raises(FileNotFoundError):
+        exp.load_artifacts()
+
+
 def test_experiment_artifact_load_keyerror(tmp_path):
     """Test trying to load an artifact that doesn't exist."""
     location = tmp_path / "my-location"
@@ -248,6 +374,30 @@ def test_experiment_comparison():
     assert exp_diff > exp
 
 
+def test_experiment_comparison_tie():
+    """Test comparing two experiments with the same timestamps but different data."""
+    created_at = datetime(2022, 1, 1, 9, 30, 0)
+    exp = Experiment(
+        name="My experiment",
+        project=Path("project.json"),
+        created_at=created_at,
+        last_updated=created_at,
+    )
+    exp_tie = Experiment(
+        name="My experiment",
+        project=Path("project.json"),
+        created_at=created_at,
+        last_updated=created_at,
+        metrics={"name": 0.5},
+    )
+
+    assert exp != exp_tie
+    assert exp_tie >= exp
+    assert exp_tie <= exp
+    assert not exp_tie > exp
+    assert not exp_tie < exp
+
+
 def test_frozen_experiment():
     """Test raising errors with a read-only experiment."""
     exp = ReadOnlyExperiment(name="My experiment", project=Path("project.json"))
@@ -257,6 +407,16 @@ def test_frozen_experiment():
     assert "lazyscribe.experiment.ReadOnlyExperiment" in str(exp)
 
 
+def test_experiment_slots():
+    """Test that experiments do not carry an instance dictionary."""
+    exp = Experiment(name="My experiment", project=Path("project.json"))
+    readonly = ReadOnlyExperiment(name="My experiment", project=Path("project.json"))
+
+    assert hasattr(Experiment, "__slots__")
+    assert not hasattr(exp, "__dict__")
+    assert not hasattr(readonly, "__dict__")
+
+
 def test_frozen_test():
     """Test raising errors with a read-only test."""
     test = ReadOnlyTest(name="my test", description="my description")
@@ -301,3 +461,11 @@ def test_experiment_artifact_log_load_output_only(tmp_path):
         assert "Artifact 'features' is not the original Python Object" in str(
             w[-1].message
         )
+
+
+def test_serializer_deprecated():
+    """Test that the ``attrs.asdict`` serializer raises a deprecation warning."""
+    with pytest.deprecated_call():
+        out = serializer(None, None, datetime(2022, 1, 1, 9, 30, 0))
+
+    assert out == "2022-01-01T09:30:00"
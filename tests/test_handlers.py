@@ -1,8 +1,12 @@
 """Test the artifact handlers."""
 
+from datetime import datetime
+from typing import ClassVar, Dict
+
 import pytest
+from attrs import define
 
-from lazyscribe.artifacts import _get_handler
+from lazyscribe.artifacts import Artifact, _get_handler, _load_entry_point
 from lazyscribe.artifacts.joblib import JoblibArtifact
 from lazyscribe.artifacts.json import JSONArtifact
 
@@ -28,6 +32,48 @@ def test_json_handler(tmp_path):
     assert data == out
 
 
+def test_handler_to_dict():
+    """Test serializing the handler metadata."""
+    created_at = datetime(2022, 1, 1, 9, 30, 0)
+    handler = JSONArtifact.construct(
+        name="My output file",
+        value=[{"key": "value"}],
+        created_at=created_at,
+        writer_kwargs={"indent": 4},
+    )
+
+    assert handler.to_dict() == {
+        "name": "My output file",
+        "fname": "my-output-file.json",
+        "created_at": "2022-01-01T09:30:00",
+        "python_version": handler.python_version,
+        "handler": "json",
+    }
+
+
+def test_handler_to_dict_nested():
+    """Test serializing handler metadata with nested datetimes."""
+
+    @define(auto_attribs=True)
+    class EnvironmentArtifact(JSONArtifact):
+        alias: ClassVar[str] = "json-env"
+        env: Dict
+
+    handler = EnvironmentArtifact(
+        name="My output file",
+        value=None,
+        fname="my-output-file.json",
+        created_at=datetime(2022, 1, 1, 9, 30, 0),
+        writer_kwargs={},
+        python_version="3.10",
+        env={"built": datetime(2022, 1, 1)},
+    )
+    out = handler.to_dict()
+
+    assert out["env"] == {"built": "2022-01-01T00:00:00"}
+    assert out["env"] is not handler.env
+
+
 def test_joblib_handler(tmp_path):
     """Test reading and writing scikit-learn estimators with the joblib handler."""
     joblib = pytest.importorskip("joblib")
@@ -128,3 +174,41 @@ def test_get_handler_import_error(mock_entry_points):
     mock_entry_points.return_value = [mock_plugin_import]
     with pytest.raises(RuntimeError):
         _get_handler(alias="dummy")
+
+
+@pytest.fixture
+def clear_handler_cache():
+    """Clear the entry point cache so mocked handlers do not leak into other tests."""
+    _load_entry_point.cache_clear()
+    yield
+    _load_entry_point.cache_clear()
+
+
+@patch("lazyscribe.artifacts.entry_points")
+def test_get_handler_cached(mock_entry_points, clear_handler_cache):
+    mock_plugin = Mock()
+    mock_plugin.name = "cached-dummy"
+    mock_plugin.load.return_value = JSONArtifact
+
+    mock_entry_points.return_value = [mock_plugin]
+    assert _get_handler("cached-dummy") == JSONArtifact
+    assert _get_handler("cached-dummy") == JSONArtifact
+    assert mock_entry_points.call_count == 1
+
+
+@patch("lazyscribe.artifacts.entry_points")
+def test_get_handler_subclass_not_cached(mock_entry_points, clear_handler_cache):
+    """Test that handlers found through subclasses are looked up on every call."""
+    mock_entry_points.return_value = []
+
+    class FirstArtifact(Artifact):
+        alias: ClassVar[str] = "subclass-dummy"
+
+    assert _get_handler("subclass-dummy") is FirstArtifact
+
+    FirstArtifact.alias = "retired-dummy"
+
+    class SecondArtifact(Artifact):
+        alias: ClassVar[str] = "subclass-dummy"
+
+    assert _get_handler("subclass-dummy") is SecondArtifact
@@ -22,6 +22,18 @@ def test_append_linked_list():
     assert null.head == Node(3, next=Node(4))
 
 
+def test_append_linked_list_new_head():
+    """Test appending to a linked list after replacing the head."""
+    lst = LinkedList()
+    lst.append(3)
+    lst.append(4)
+    lst.head = Node(1, next=Node(2))
+    lst.append(5)
+
+    assert lst.head == Node(1, next=Node(2, next=Node(5)))
+    assert lst.tail == Node(5)
+
+
 def test_linked_list_conversion():
     """Test converting a list of integers to a sorted linked list."""
     lst = [1, 2, 1, 3, 4]
@@ -187,6 +187,43 @@ def test_prefect_project(parametrized, tmp_path):
     assert project_location.exists()
 
 
+def test_prefect_experiment_batch_logging(tmp_path):
+    """Test logging multiple metrics and parameters with a single task each."""
+    location = tmp_path / "my-location"
+    location.mkdir()
+
+    init_experiment = LazyExperiment()
+    with Flow(name="Create experiment") as flow:
+        experiment = init_experiment(
+            project=location / "project.json", name="My experiment", author="root"
+        )
+        experiment.log_metrics({"name": 0.5, "other": 0.3})
+        experiment.log_parameters({"param": "value"})
+        with experiment.log_test(name="My test") as test:
+            test.log_metrics({"subpop": 0.7})
+            test.log_parameters({"param": "value"})
+
+    assert {tsk.name for tsk in flow.downstream_tasks(experiment)} == {
+        "Log experiment metrics",
+        "Log parameters",
+        "Append test",
+    }
+    assert {tsk.name for tsk in flow.downstream_tasks(test)} == {
+        "Log test metrics",
+        "Log test parameters",
+        "Append test",
+    }
+
+    output = flow.run()
+    exp = output.result[experiment].result
+
+    assert output.is_successful()
+    assert exp.metrics == {"name": 0.5, "other": 0.3}
+    assert exp.parameters == {"param": "value"}
+    assert exp.tests[0].metrics == {"subpop": 0.7}
+    assert exp.tests[0].parameters == {"param": "value"}
+
+
 def test_prefect_project_merge():
     """Test merging projects with prefect."""
     init_base = LazyProject(fpath=DATA_DIR / "project.json", mode="r")
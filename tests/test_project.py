@@ -371,6 +371,17 @@ def test_load_project_dependencies():
     assert project.experiments == [expected]
 
 
+def test_load_project_dependencies_once():
+    """Test that an upstream project is only read once when loading dependencies."""
+    with patch.object(Project, "load", autospec=True, side_effect=Project.load) as load:
+        Project(fpath=DATA_DIR / "down-project.json", mode="a")
+
+    assert [call.args[0].fpath.name for call in load.call_args_list] == [
+        "down-project.json",
+        "project.json",
+    ]
+
+
 def test_merge_append():
     """Test merging a project with one that has an extra experiment."""
     current = Project(fpath=DATA_DIR / "project.json", mode="r")
@@ -405,6 +416,43 @@ def test_merge_append():
     ]
 
 
+def test_merge_empty(tmp_path):
+    """Test merging two projects without any experiments."""
+    current = Project(fpath=tmp_path / "project.json")
+    other = Project(fpath=tmp_path / "other.json")
+
+    new = current.merge(other)
+
+    assert new.experiments == []
+
+
+def test_merge_same_created_at(tmp_path):
+    """Test merging experiments that were created in the same second."""
+    created_at = datetime(2022, 1, 1, 9, 0, 0)
+
+    def _make(name: str, second: int) -> Experiment:
+        return Experiment(
+            name=name,
+            project=tmp_path / "project.json",
+            author="root",
+            created_at=created_at,
+            last_updated=datetime(2022, 1, 1, 9, 0, second),
+        )
+
+    current = Project(fpath=tmp_path / "project.json")
+    current.experiments = [_make("b", 1)]
+    other = Project(fpath=tmp_path / "other.json")
+    newer_b = _make("b", 3)
+    a = _make("a", 1)
+    other.experiments = [newer_b, a]
+
+    new = current.merge(other)
+
+    assert len(new.experiments) == 2
+    assert new.experiments[0] is newer_b
+    assert new.experiments[1] is a
+
+
 def test_merge_distinct():
     """Test merging two projects with the no overlapping data."""
     current = Project(fpath=DATA_DIR / "project.json", mode="r")